@@ -1,5 +1,7 @@
 # main.py
-from fastapi import FastAPI, Body, Path, Query, File, UploadFile
+# Chạy server: uvicorn main:app (hoặc python main.py); loop mặc định "auto" tự dùng uvloop nếu đã cài
+import orjson
+from fastapi import FastAPI, Body, Path, Query, File, UploadFile, Response
 from fastapi.middleware.cors import CORSMiddleware  # Thêm dòng này
 from pydantic import BaseModel, Field
 from typing import Optional, Any, Dict
@@ -11,6 +13,41 @@ app = FastAPI(
     version="1.0.1",
 )
 
+# --- CORS Middleware ---
+class PrecomputedCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware với header CORS được dựng sẵn dạng bytes khi cho phép mọi origin,
+    tránh tạo MutableHeaders và cập nhật từng header ở mỗi response.
+    """
+    _CORS_HEADER_NAMES = {b"access-control-allow-origin", b"access-control-allow-credentials", b"access-control-expose-headers", b"vary"}
+
+    def __init__(self, app, **kwargs):
+        super().__init__(app, **kwargs)
+        self._simple_raw_headers = tuple((name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in self.simple_headers.items())
+
+    async def send(self, message, send, request_headers):
+        if message["type"] != "http.response.start" or not self.allow_all_origins:
+            await super().send(message, send, request_headers)
+            return
+
+        raw_headers = message.get("headers", [])
+        if any(name.lower() in self._CORS_HEADER_NAMES for name, _ in raw_headers):
+            # Response đã tự đặt header CORS/Vary: để CORSMiddleware gộp header như bình thường
+            await super().send(message, send, request_headers)
+            return
+
+        origin = request_headers.get("origin")
+        if origin is None:
+            cors_headers = []
+        elif self.allow_credentials:
+            # Cho phép credentials thì phải trả về đúng origin của request thay vì '*'
+            origin_raw = origin.encode("latin-1")
+            cors_headers = [(name, origin_raw if name == b"access-control-allow-origin" else value) for name, value in self._simple_raw_headers]
+        else:
+            cors_headers = list(self._simple_raw_headers)
+        message["headers"] = [*raw_headers, *cors_headers, (b"vary", b"Origin")]
+        await send(message)
+
 # --- Cấu hình CORS ---
 # Thêm đoạn này để cho phép các trang web khác gọi đến API của bạn
 origins = [
@@ -19,7 +56,7 @@ origins = [
 ]
 
 app.add_middleware(
-    CORSMiddleware,
+    PrecomputedCORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],  # Cho phép tất cả các phương thức (GET, POST, etc.)
@@ -41,128 +78,160 @@ class SlackMessagePayload(BaseModel):
     channel: str = Field(..., example="#general")
     text: str = Field(..., example="Hello, world!")
 
+# --- Cached Responses ---
+# Các endpoint chỉ đọc trả về nội dung cố định: serialize một lần khi khởi động,
+# mỗi request chỉ cần gửi lại bytes đã có sẵn
+def _cached_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize payload cố định thành JSON bytes."""
+    return orjson.dumps(payload)
+
+def _json_response(body: bytes) -> Response:
+    """Tạo response từ JSON bytes đã serialize sẵn."""
+    return Response(content=body, media_type="application/json")
+
+_USER_ME_BODY = _cached_json({"endpoint": "/dnse-user-service/api/me", "user_info": {"id": "user123", "name": "Nguyễn Văn A"}})
+_SJC_HOMEPAGE_BODY = _cached_json({"endpoint": "/sjc", "message": "Chào mừng đến SJC"})
+_SJC_GOLD_PRICE_BODY = _cached_json({"endpoint": "/sjc/GoldPrice/Services/PriceService.ashx", "data": "Dữ liệu giá vàng ở đây"})
+_SJC_PRICE_CHART_BODY = _cached_json({"endpoint": "/sjc/bieu-do-gia-vang", "data": "Dữ liệu biểu đồ ở đây"})
+_TCBS_HOMEPAGE_BODY = _cached_json({"endpoint": "/tcinvest.tcbs.com.vn", "message": "Chào mừng đến TCBS TCIvest"})
+_VIETCAP_HOMEPAGE_BODY = _cached_json({"endpoint": "/trading.vietcap.com.vn/"})
+_VIETCAP_API_ROOT_BODY = _cached_json({"endpoint": "/trading.vietcap.com.vn/api/"})
+_VNSTOCKS_CHANGELOG_BODY = _cached_json({"endpoint": "/vnstocks/docs/tai-lieu/lich-su-phien-ban", "version": "1.0.0"})
+_MSN_HOMEPAGE_BODY = _cached_json({"endpoint": "/msn", "message": "Chào mừng đến MSN"})
+
 # --- API Endpoints ---
 # (Toàn bộ các endpoint giữ nguyên như cũ)
 
 # 1. Active Orders
 @app.get("/attive/orders", tags=["Entrade"])
-async def get_active_orders(accountNo: str = Query(..., description="Số tài khoản phụ")):
+async def get_active_orders(accountNo: str = Query(..., description="Số tài khoản phụ")) -> Dict[str, Any]:
     """Lấy danh sách lệnh đang hoạt động."""
     return {"endpoint": "/attive/orders", "accountNo": accountNo, "message": "Lấy danh sách lệnh thành công"}
 
 # 2. Trading Token (Entrade)
 @app.post("/dnse-order-service/trading-token", tags=["Entrade"])
-async def get_trading_token():
+async def get_trading_token() -> Dict[str, Any]:
     """Lấy trading token."""
     return {"endpoint": "/dnse-order-service/trading-token", "token": "mock_trading_token_string"}
 
 # 3. Create Order (Entrade) - POST
 @app.post("/dnse-order-service/v2/orders", tags=["Entrade"])
-async def create_order(order: OrderPayload):
+async def create_order(order: OrderPayload) -> Dict[str, Any]:
     """Tạo một lệnh mới."""
-    return {"endpoint": "/dnse-order-service/v2/orders", "status": "Lệnh đã được tạo", "data": order.dict()}
+    return {"endpoint": "/dnse-order-service/v2/orders", "status": "Lệnh đã được tạo", "data": order.model_dump()}
 
 # 4. Get/Update/Delete Order by ID (Entrade)
 @app.get("/dnse-order-service/v2/orders/{order_id}", tags=["Entrade"])
-async def get_order_by_id(order_id: str = Path(..., description="ID của lệnh"), accountNo: str = Query(..., description="Số tài khoản phụ")):
+async def get_order_by_id(order_id: str = Path(..., description="ID của lệnh"), accountNo: str = Query(..., description="Số tài khoản phụ")) -> Dict[str, Any]:
     """Lấy thông tin một lệnh cụ thể."""
     return {"endpoint": f"/dnse-order-service/v2/orders/{order_id}", "order_id": order_id, "accountNo": accountNo}
 
 @app.put("/dnse-order-service/v2/orders/{order_id}", tags=["Entrade"])
-async def update_order(order_id: str = Path(..., description="ID của lệnh"), accountNo: str = Query(..., description="Số tài khoản phụ"), order_update: OrderPayload = Body(...)):
+async def update_order(order_id: str = Path(..., description="ID của lệnh"), accountNo: str = Query(..., description="Số tài khoản phụ"), order_update: OrderPayload = Body(...)) -> Dict[str, Any]:
     """Cập nhật (sửa) một lệnh."""
-    return {"endpoint": f"/dnse-order-service/v2/orders/{order_id}", "status": "Lệnh đã được cập nhật", "order_id": order_id, "accountNo": accountNo, "update_data": order_update.dict()}
+    return {"endpoint": f"/dnse-order-service/v2/orders/{order_id}", "status": "Lệnh đã được cập nhật", "order_id": order_id, "accountNo": accountNo, "update_data": order_update.model_dump()}
 
 @app.delete("/dnse-order-service/v2/orders/{order_id}", tags=["Entrade"])
-async def cancel_order(order_id: str = Path(..., description="ID của lệnh"), accountNo: str = Query(..., description="Số tài khoản phụ")):
+async def cancel_order(order_id: str = Path(..., description="ID của lệnh"), accountNo: str = Query(..., description="Số tài khoản phụ")) -> Dict[str, Any]:
     """Hủy một lệnh."""
     return {"endpoint": f"/dnse-order-service/v2/orders/{order_id}", "status": "Lệnh đã được hủy", "order_id": order_id, "accountNo": accountNo}
 
 # 5. List Orders (Entrade) - GET
 @app.get("/dnse-order-service/v2/orders", tags=["Entrade"])
-async def list_orders(accountNo: str = Query(..., description="Số tài khoản phụ")):
+async def list_orders(accountNo: str = Query(..., description="Số tài khoản phụ")) -> Dict[str, Any]:
     """Lấy danh sách các lệnh."""
     return {"endpoint": "/dnse-order-service/v2/orders", "accountNo": accountNo, "message": "Lấy danh sách lệnh thành công"}
 
 # 6. Auth (Entrade User Service)
 @app.post("/dnse-user-service/api/auth", tags=["Entrade"])
-async def authenticate_user(payload: AuthPayload):
+async def authenticate_user(payload: AuthPayload) -> Dict[str, Any]:
     """Xác thực người dùng."""
     return {"endpoint": "/dnse-user-service/api/auth", "status": "Xác thực thành công", "user": payload.username}
 
 # 7. Get User Info (Entrade User Service)
 @app.get("/dnse-user-service/api/me", tags=["Entrade"])
-async def get_user_me():
+async def get_user_me() -> Response:
     """Lấy thông tin người dùng hiện tại."""
-    return {"endpoint": "/dnse-user-service/api/me", "user_info": {"id": "user123", "name": "Nguyễn Văn A"}}
+    return _json_response(_USER_ME_BODY)
 
 # 8. SJC Homepage
 @app.get("/sjc", tags=["SJC"])
-async def sjc_homepage():
+async def sjc_homepage() -> Response:
     """Endpoint mô phỏng trang chủ SJC."""
-    return {"endpoint": "/sjc", "message": "Chào mừng đến SJC"}
+    return _json_response(_SJC_HOMEPAGE_BODY)
 
 # 9. SJC Price Service
 @app.get("/sjc/GoldPrice/Services/PriceService.ashx", tags=["SJC"])
-async def get_sjc_gold_price():
+async def get_sjc_gold_price() -> Response:
     """Lấy giá vàng từ SJC."""
-    return {"endpoint": "/sjc/GoldPrice/Services/PriceService.ashx", "data": "Dữ liệu giá vàng ở đây"}
+    return _json_response(_SJC_GOLD_PRICE_BODY)
 
 # 10. SJC Price Chart
 @app.get("/sjc/bieu-do-gia-vang", tags=["SJC"])
-async def get_sjc_price_chart():
+async def get_sjc_price_chart() -> Response:
     """Lấy dữ liệu biểu đồ giá vàng SJC."""
-    return {"endpoint": "/sjc/bieu-do-gia-vang", "data": "Dữ liệu biểu đồ ở đây"}
+    return _json_response(_SJC_PRICE_CHART_BODY)
 
 # 11. Slack Post Message
 @app.post("/slack/api/chat.postMessage", tags=["Slack"])
-async def slack_post_message(payload: SlackMessagePayload):
+async def slack_post_message(payload: SlackMessagePayload) -> Dict[str, Any]:
     """Gửi tin nhắn đến Slack."""
     return {"endpoint": "/slack/api/chat.postMessage", "ok": True, "message": f"Tin nhắn đã được gửi đến kênh {payload.channel}"}
 
 # 12. Slack File Upload
 @app.post("/slack/api/files_upload", tags=["Slack"])
-async def slack_upload_file(file: UploadFile = File(...), channel: str = Body(...)):
+async def slack_upload_file(file: UploadFile = File(...), channel: str = Body(...)) -> Dict[str, Any]:
     """Tải file lên Slack."""
     return {"endpoint": "/slack/api/files_upload", "ok": True, "file_details": {"filename": file.filename, "content_type": file.content_type, "channel": channel}}
 
 # 13. TCBS Homepage
 @app.get("/tcinvest.tcbs.com.vn", tags=["TCBS"])
-async def tcbs_homepage():
+async def tcbs_homepage() -> Response:
     """Endpoint mô phỏng trang chủ TCBS."""
-    return {"endpoint": "/tcinvest.tcbs.com.vn", "message": "Chào mừng đến TCBS TCIvest"}
+    return _json_response(_TCBS_HOMEPAGE_BODY)
 
 # 14 & 15. Vietcap Trading
 @app.get("/trading.vietcap.com.vn/", tags=["Vietcap"])
-async def vietcap_homepage():
+async def vietcap_homepage() -> Response:
     """Endpoint mô phỏng trang chủ Vietcap."""
-    return {"endpoint": "/trading.vietcap.com.vn/"}
+    return _json_response(_VIETCAP_HOMEPAGE_BODY)
 
 @app.get("/trading.vietcap.com.vn/api/", tags=["Vietcap"])
-async def vietcap_api_root():
+async def vietcap_api_root() -> Response:
     """Endpoint mô phỏng API gốc của Vietcap."""
-    return {"endpoint": "/trading.vietcap.com.vn/api/"}
+    return _json_response(_VIETCAP_API_ROOT_BODY)
 
 # 16. Vietcap GraphQL
-@app.api_route("/trading.vietcap.com.vn/data-mt/graphql", methods=["GET", "POST"], tags=["Vietcap"])
-async def vietcap_graphql_endpoint(query: Optional[Dict[str, Any]] = None):
+@app.get("/trading.vietcap.com.vn/data-mt/graphql", tags=["Vietcap"])
+@app.post("/trading.vietcap.com.vn/data-mt/graphql", tags=["Vietcap"])
+async def vietcap_graphql_endpoint(query: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Endpoint mô phỏng GraphQL của Vietcap."""
     return {"endpoint": "/trading.vietcap.com.vn/data-mt/graphql", "message": "GraphQL endpoint", "received_query": query}
 
 # 17. VnStocks Docs
 @app.get("/vnstocks/docs/tai-lieu/lich-su-phien-ban", tags=["VnStocks"])
-async def get_vnstocks_changelog():
+async def get_vnstocks_changelog() -> Response:
     """Endpoint mô phỏng trang tài liệu VnStocks."""
-    return {"endpoint": "/vnstocks/docs/tai-lieu/lich-su-phien-ban", "version": "1.0.0"}
+    return _json_response(_VNSTOCKS_CHANGELOG_BODY)
 
 # 18. MSN
 @app.get("/msn", tags=["Khác"])
-async def msn_homepage():
+async def msn_homepage() -> Response:
     """Endpoint mô phỏng trang MSN."""
-    return {"endpoint": "/msn", "message": "Chào mừng đến MSN"}
+    return _json_response(_MSN_HOMEPAGE_BODY)
 
 # 19. Vietcombank Exchange Rates
 @app.get("/vietcombank/api/exchangerates/exportexcel", tags=["Vietcombank"])
-async def get_vcb_exchange_rates(date: str = Query(..., description="Ngày xuất dữ liệu, định dạng YYYY-MM-DD")):
+async def get_vcb_exchange_rates(date: str = Query(..., description="Ngày xuất dữ liệu, định dạng YYYY-MM-DD")) -> Dict[str, Any]:
     """Lấy tỷ giá Vietcombank theo ngày."""
     return {"endpoint": "/vietcombank/api/exchangerates/exportexcel", "date": date, "message": f"Đang xuất file Excel tỷ giá cho ngày {date}"}
+
+# --- OpenAPI ---
+# Tạo sẵn schema khi khởi động để lần gọi /openapi.json và /docs đầu tiên không phải dựng lại
+app.openapi()  # Lưu kết quả vào app.openapi_schema
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" dùng uvloop khi có (uvicorn[standard] trên Linux/macOS), ngược lại dùng asyncio
+    uvicorn.run(app, loop="auto")
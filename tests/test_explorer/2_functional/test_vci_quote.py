@@ -0,0 +1,198 @@
+import os
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from vnstock.explorer.vci.quote import Quote, _validate_ticker
+
+def _ohlc_item(symbol=None, close=10000.0):
+    item = {
+        "t": [1704153600, 1704240000],
+        "o": [close, close],
+        "h": [close, close],
+        "l": [close, close],
+        "c": [close, close],
+        "v": [100, 200],
+    }
+    if symbol is not None:
+        item["symbol"] = symbol
+    return item
+
+class TestVCIQuoteValidation(unittest.TestCase):
+    def test_padded_and_unpadded_dates_are_accepted(self):
+        for start, end in [("2024-01-05", "2024-02-10"), ("2024-1-5", "2024-2-10")]:
+            with self.subTest(start=start, end=end):
+                ticker = _validate_ticker("ACB", start, end, "1D")
+                self.assertEqual((ticker.start, ticker.end), (start, end))
+
+    def test_malformed_start_raises(self):
+        with self.assertRaisesRegex(ValueError, "Thời gian bắt đầu không hợp lệ: 01/05/2024"):
+            _validate_ticker("ACB", "01/05/2024", None, "1D")
+
+    def test_malformed_end_raises(self):
+        with self.assertRaisesRegex(ValueError, "Thời gian kết thúc không hợp lệ: 2024-01-05 10:00"):
+            _validate_ticker("ACB", "2024-01-01", "2024-01-05 10:00", "1D")
+
+    def test_invalid_interval_raises(self):
+        with self.assertRaisesRegex(ValueError, "Giá trị interval không hợp lệ: 2D"):
+            _validate_ticker("ACB", "2024-01-01", None, "2D")
+
+class TestVCIQuoteTimeRange(unittest.TestCase):
+    def setUp(self):
+        self.quote = Quote("ACB")
+
+    def _count_back(self, start, end, interval):
+        return self.quote._time_range(_validate_ticker("ACB", start, end, interval))[1]
+
+    def test_count_back_per_interval(self):
+        # Khoảng 2024-01-01 đến hết 2024-01-02 dài đúng 2 ngày
+        expected = {"1m": 2880, "5m": 576, "15m": 192, "30m": 96, "1H": 48, "1D": 2, "1W": 1}
+        for interval, count in expected.items():
+            with self.subTest(interval=interval):
+                self.assertEqual(self._count_back("2024-01-01", "2024-01-02", interval), count)
+
+    def test_minute_and_month_intervals_are_distinct(self):
+        self.assertEqual(self._count_back("2024-01-01", "2024-03-31", "1M"), 3)
+        self.assertEqual(self._count_back("2024-01-01", "2024-03-31", "1m"), 91 * 24 * 60)
+
+    def test_explicit_count_back_is_kept(self):
+        self.assertEqual(self.quote._time_range(_validate_ticker("ACB", "2024-01-01", "2024-01-02", "1D"), 5)[1], 5)
+
+    def test_end_none_counts_until_tomorrow(self):
+        start = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+        self.assertEqual(self._count_back(start, None, "1D"), 11)
+
+    @unittest.skipUnless(hasattr(time, "tzset"), "time.tzset không khả dụng trên nền tảng này")
+    def test_count_back_ignores_dst(self):
+        old_tz = os.environ.get("TZ")
+        os.environ["TZ"] = "America/New_York"
+        time.tzset()
+        try:
+            # Khoảng thời gian đi qua ngày chuyển giờ mùa hè 2021-03-14 tại New York
+            self.assertEqual(self._count_back("2021-03-05", "2021-04-22", "1D"), 49)
+            self.assertEqual(self._count_back("2021-03-05", "2021-04-22", "1W"), 7)
+            self.assertEqual(self._count_back("2021-03-13", "2021-03-14", "1H"), 48)
+        finally:
+            if old_tz is None:
+                os.environ.pop("TZ", None)
+            else:
+                os.environ["TZ"] = old_tz
+            time.tzset()
+
+class TestVCIQuoteHistoryMany(unittest.TestCase):
+    def setUp(self):
+        # Bỏ qua kiểm tra hạn mức request của vnai vì send_request đã được mock
+        patcher = patch("vnai.beam.quota.guardian.verify")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.quote = Quote("ACB")
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_many_returns_all_symbols_in_order(self, mock_send):
+        mock_send.side_effect = lambda **kwargs: [_ohlc_item(kwargs["payload"]["symbols"][0])]
+        result = self.quote.history_many(["FPT", "VCB", "HPG"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["FPT", "VCB", "HPG"])
+        self.assertEqual(len(result["FPT"]), 2)
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_many_skips_failed_symbols(self, mock_send):
+        def _send(**kwargs):
+            if kwargs["payload"]["symbols"][0] == "VCB":
+                raise ConnectionError("timeout")
+            return [_ohlc_item()]
+        mock_send.side_effect = _send
+        with self.assertLogs("vnstock.explorer.vci.quote", level="WARNING") as logs:
+            result = self.quote.history_many(["FPT", "VCB", "HPG"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["FPT", "HPG"])
+        self.assertTrue(any("VCB" in line for line in logs.output))
+        self.assertEqual(list(self.quote.failed_symbols), ["VCB"])
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_many_reports_failures_when_logging_is_off(self, mock_send):
+        quote = Quote("ACB", show_log=False)
+        mock_send.side_effect = lambda **kwargs: [] if kwargs["payload"]["symbols"][0] == "VCB" else [_ohlc_item()]
+        result = quote.history_many(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["FPT"])
+        self.assertIn("Không tìm thấy dữ liệu", quote.failed_symbols["VCB"])
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_many_raises_when_every_symbol_fails(self, mock_send):
+        quote = Quote("ACB", show_log=False)
+        mock_send.side_effect = ConnectionError("timeout")
+        with self.assertRaisesRegex(ValueError, "FPT: timeout"):
+            quote.history_many(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(set(quote.failed_symbols), {"FPT", "VCB"})
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_many_validates_arguments_before_fetching(self, mock_send):
+        quote = Quote("ACB", show_log=False)
+        with self.assertRaisesRegex(ValueError, "Thời gian bắt đầu không hợp lệ"):
+            quote.history_many(["FPT"], start="01/01/2024")
+        mock_send.assert_not_called()
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_many_empty_symbols(self, mock_send):
+        self.assertEqual(self.quote.history_many([], start="2024-01-01"), {})
+        mock_send.assert_not_called()
+
+class TestVCIQuoteHistoryBatch(unittest.TestCase):
+    def setUp(self):
+        # Bỏ qua kiểm tra hạn mức request của vnai vì send_request đã được mock
+        patcher = patch("vnai.beam.quota.guardian.verify")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.quote = Quote("ACB")
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_matches_by_symbol(self, mock_send):
+        mock_send.return_value = [_ohlc_item("VCB", close=20000.0), _ohlc_item("FPT", close=10000.0)]
+        result = self.quote.history_batch(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["FPT", "VCB"])
+        self.assertEqual(result["FPT"]["close"].iloc[0], 10.0)
+        self.assertEqual(result["VCB"]["close"].iloc[0], 20.0)
+        self.assertEqual(mock_send.call_args.kwargs["payload"]["symbols"], ["FPT", "VCB"])
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_falls_back_to_request_order(self, mock_send):
+        mock_send.return_value = [_ohlc_item(close=10000.0), _ohlc_item(close=20000.0)]
+        result = self.quote.history_batch(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(result["FPT"]["close"].iloc[0], 10.0)
+        self.assertEqual(result["VCB"]["close"].iloc[0], 20.0)
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_skips_symbols_without_data(self, mock_send):
+        mock_send.return_value = [_ohlc_item("FPT")]
+        with self.assertLogs("vnstock.explorer.vci.quote", level="WARNING") as logs:
+            result = self.quote.history_batch(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["FPT"])
+        self.assertTrue(any("VCB" in line for line in logs.output))
+        self.assertEqual(list(self.quote.failed_symbols), ["VCB"])
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_reports_missing_symbols_when_logging_is_off(self, mock_send):
+        quote = Quote("ACB", show_log=False)
+        mock_send.return_value = [_ohlc_item("FPT")]
+        result = quote.history_batch(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["FPT"])
+        self.assertEqual(list(quote.failed_symbols), ["VCB"])
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_empty_symbols(self, mock_send):
+        self.assertEqual(self.quote.history_batch([], start="2024-01-01"), {})
+        mock_send.assert_not_called()
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_keys_index_by_requested_symbol(self, mock_send):
+        mock_send.return_value = [_ohlc_item("VNINDEX"), _ohlc_item("HNXIndex")]
+        result = self.quote.history_batch(["VNINDEX", "HNXINDEX"], start="2024-01-01", end="2024-01-03")
+        self.assertEqual(list(result.keys()), ["VNINDEX", "HNXINDEX"])
+        self.assertEqual(mock_send.call_args.kwargs["payload"]["symbols"], ["VNINDEX", "HNXIndex"])
+
+    @patch("vnstock.explorer.vci.quote.send_request")
+    def test_history_batch_rejects_unlabelled_data_of_wrong_length(self, mock_send):
+        mock_send.return_value = [_ohlc_item()]
+        with self.assertRaises(ValueError):
+            self.quote.history_batch(["FPT", "VCB"], start="2024-01-01", end="2024-01-03")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,14 +9,14 @@ class TestClientUtils(unittest.TestCase):
         self.proxy_list = ["http://proxy1.com", "http://proxy2.com"]
         self.payload = {"key": "value"}
 
-    @patch("vnstock.core.utils.client.requests.get")
+    @patch("vnstock.core.utils.client._session.get")
     def test_send_request_direct_get(self, mock_get):
         mock_get.return_value.status_code = 200
         mock_get.return_value.json.return_value = {"result": "ok"}
         result = client.send_request_direct(self.url, self.headers)
         self.assertEqual(result, {"result": "ok"})
 
-    @patch("vnstock.core.utils.client.requests.post")
+    @patch("vnstock.core.utils.client._session.post")
     def test_send_request_direct_post(self, mock_post):
         mock_post.return_value.status_code = 200
         mock_post.return_value.json.return_value = {"result": "posted"}
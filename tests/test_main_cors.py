@@ -0,0 +1,42 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from main import PrecomputedCORSMiddleware
+
+CORS_CONFIGS = [
+    dict(allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"]),
+    dict(allow_origins=["*"], expose_headers=["X-Request-Id"]),
+    dict(allow_origins=["https://example.com"], allow_credentials=True),
+]
+
+def _make_client(middleware, **config):
+    app = FastAPI()
+
+    @app.get("/plain")
+    def plain():
+        return {"ok": True}
+
+    @app.get("/vary")
+    def vary():
+        return JSONResponse({"ok": True}, headers={"Vary": "Accept-Encoding"})
+
+    app.add_middleware(middleware, **config)
+    return TestClient(app)
+
+@pytest.mark.parametrize("config", CORS_CONFIGS)
+@pytest.mark.parametrize("path, headers", [
+    ("/plain", {}),
+    ("/plain", {"Origin": "https://example.com"}),
+    ("/plain", {"Origin": "https://example.com", "Cookie": "session=abc"}),
+    ("/vary", {"Origin": "https://example.com"}),
+])
+def test_precomputed_cors_matches_stock_middleware(config, path, headers):
+    """
+    PrecomputedCORSMiddleware phải trả về đúng các header như CORSMiddleware gốc của Starlette.
+    """
+    expected = _make_client(CORSMiddleware, **config).get(path, headers=headers)
+    actual = _make_client(PrecomputedCORSMiddleware, **config).get(path, headers=headers)
+    assert actual.status_code == expected.status_code
+    assert sorted(actual.headers.multi_items()) == sorted(expected.headers.multi_items())
@@ -9,9 +9,13 @@ Functions:
 - send_request_direct: send request directly
 - send_request_hf_proxy: send request via Hugging Face proxy
 - send_proxy_request: gửi request qua proxy thông thường
+- decode_json: decode JSON từ response (dùng orjson nếu có)
 """
 
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import random
 from typing import Dict, Any, Optional, Union, List
@@ -19,6 +23,13 @@ from enum import Enum
 from pydantic import BaseModel
 from vnstock.core.utils.logger import get_logger
 
+# Dùng orjson để decode JSON nếu đã cài đặt (nhanh hơn json chuẩn nhiều lần với payload lớn)
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 # Khởi tạo logger cho module
 logger = get_logger(__name__)
 
@@ -63,6 +74,30 @@ class RequestMode(Enum):
 # Biến toàn cục để theo dõi index proxy hiện tại cho chế độ ROTATE
 _current_proxy_index = 0
 
+# Kích thước connection pool cho session dùng chung
+POOL_CONNECTIONS = 10  # Số host được giữ pool riêng
+POOL_MAXSIZE = 50  # Số kết nối keep-alive tối đa cho mỗi host
+CONNECT_RETRIES = 1  # Số lần thử lại khi không mở được kết nối tới server (lỗi đọc/kết nối keep-alive bị đóng không được thử lại)
+
+def _create_session() -> requests.Session:
+    """
+    Tạo session HTTP với connection pool để tái sử dụng kết nối TCP/TLS giữa các request.
+    Returns:
+        requests.Session: Session đã gắn HTTPAdapter với pool
+    """
+    session = requests.Session()
+    # Không lưu cookie giữa các request để session dùng chung không mang trạng thái giữa các nguồn/lời gọi
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    # Chỉ thử lại lỗi kết nối, không gửi lại request đã tới server và không tự theo redirect
+    retries = Retry(total=CONNECT_RETRIES, connect=CONNECT_RETRIES, read=0, status=0, other=0, redirect=False)
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Session dùng chung cho toàn bộ request, tránh bắt tay TCP/TLS lại ở mỗi lần gọi
+_session = _create_session()
+
 # Danh sách các Hugging Face proxy URL (có thể mở rộng)
 HF_PROXY_URLS = [
     "https://YOUR_SPACE_NAME.hf.space/proxy",
@@ -326,7 +361,7 @@ def send_request_direct(
     try:
         # Xử lý GET/POST
         if method.upper() == "GET":
-            response = requests.get(
+            response = _session.get(
                 url, headers=headers, params=params, timeout=timeout, proxies=proxies
             )
         else:  # POST
@@ -339,7 +374,7 @@ def send_request_direct(
                     raise ValueError("Payload must be either a dictionary or a raw string.")
             else:
                 data_arg = None
-            response = requests.post(
+            response = _session.post(
                 url, headers=headers, data=data_arg, timeout=timeout, proxies=proxies
             )
         # Kiểm tra mã trả về
@@ -347,12 +382,28 @@ def send_request_direct(
             raise ConnectionError(
                 f"Failed to fetch data: {response.status_code} - {response.reason}"
             )
-        return response.json()
+        return decode_json(response)
     except requests.exceptions.RequestException as e:
         error_msg = f"API request failed: {str(e)}"
         logger.error(error_msg)
         raise ConnectionError(error_msg)
 
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode JSON từ response, ưu tiên orjson nếu có và quay về response.json() khi không dùng được.
+    Args:
+        response (requests.Response): Response trả về từ request
+    Returns:
+        Any: Dữ liệu JSON đã decode
+    """
+    if orjson_available:
+        try:
+            return orjson.loads(response.content)
+        except (ValueError, TypeError):
+            # Nội dung không phải JSON UTF-8 hợp lệ, để response.json() xử lý như trước
+            pass
+    return response.json()
+
 def reset_proxy_rotation():
     """
     Reset proxy rotation index về 0.
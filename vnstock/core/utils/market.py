@@ -2,8 +2,10 @@
 # Simple utility to check market trading hours and data availability
 
 import datetime
+import time
 import pytz
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 # Setup logging
@@ -245,6 +247,27 @@ def trading_hours(market: str = "HOSE", custom_time: Optional[datetime.datetime]
         "market": market_display
     }
 
+@lru_cache(maxsize=8)
+def _trading_hours_bucket(market: Optional[str], time_bucket: int) -> Dict[str, Any]:
+    """
+    Compute trading status once per time bucket; time_bucket only serves as the cache key.
+    """
+    return trading_hours(market)
+
+def cached_trading_hours(market: Optional[str] = "HOSE", ttl: int = 10) -> Dict[str, Any]:
+    """
+    Same as trading_hours(market) but reuses the result for up to `ttl` seconds.
+    Trading sessions change on minute boundaries, so this is safe for callers polling in a loop.
+    
+    Args:
+        market (str): Market to check, see trading_hours
+        ttl (int): Number of seconds a computed result is reused
+        
+    Returns:
+        dict: Trading status information, see trading_hours (shared between callers, do not modify)
+    """
+    return _trading_hours_bucket(market, int(time.time()) // ttl)
+
 # # Example usage
 # if __name__ == "__main__":
 #     print(check_market_hours(market="HOSE", custom_time=datetime.datetime(2025, 3, 17, 10, 0, 0), enable_log=True, language="en"))
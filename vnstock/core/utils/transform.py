@@ -111,11 +111,17 @@ def process_match_types(df, asset_type, source):
 
 def ohlc_to_df(data: Dict[str, Any], column_map: Dict[str, str], dtype_map: Dict[str, str],
               asset_type: str, symbol: str, source: str, interval: str = "1D",
-              floating: int = 2, resample_map: Optional[Dict[str, str]] = None) -> pd.DataFrame:
-    """Convert OHLC data from any source to standardized DataFrame format."""
+              floating: int = 2, resample_map: Optional[Dict[str, str]] = None,
+              count_back: Optional[int] = None) -> pd.DataFrame:
+    """Convert OHLC data from any source to standardized DataFrame format, keeping only the last count_back bars if given."""
     if not data:
         raise ValueError("Input data is empty or not provided.")
-        
+
+    needs_resample = bool(resample_map) and interval not in ["1m", "1H", "1D"]
+    price_columns = ["open", "high", "low", "close"]
+    # Price scaling for non-index/derivative assets
+    price_scale = 1000 if asset_type not in ["index", "derivative"] else None
+
     # Handle different data source formats
     if source == 'TCBS':
         # TCBS data is already a list of dictionaries
@@ -123,10 +129,25 @@ def ohlc_to_df(data: Dict[str, Any], column_map: Dict[str, str], dtype_map: Dict
         # Apply column mapping directly through rename
         df.rename(columns=column_map, inplace=True)
     else:
-        # VCI and other sources
-        # Select and rename columns using dictionary comprehension
-        columns_of_interest = {key: column_map[key] for key in column_map.keys() if key in data}
-        df = pd.DataFrame(data)[columns_of_interest.keys()].rename(columns=column_map)
+        # VCI and other sources return columnar arrays keyed by field name:
+        # build each column straight into a typed numpy buffer instead of going through records
+        # Without resampling one input bar is one output bar, so trim to count_back before conversion
+        trim = count_back if count_back and not needs_resample else None
+        columns = {}
+        for key, col in column_map.items():
+            if key not in data:
+                continue
+            values = data[key] if trim is None else data[key][-trim:]
+            # Timestamps stay as epoch integers here, converted to datetime below
+            dtype = 'int64' if col == 'time' else dtype_map.get(col)
+            values = np.asarray(values, dtype=dtype)
+            # Scale and round prices on the typed buffer in the same pass
+            if col in price_columns:
+                if price_scale:
+                    values = values / price_scale
+                values = np.round(values, floating)
+            columns[col] = values
+        df = pd.DataFrame(columns, copy=False)
     
     # Ensure all required columns exist
     required_columns = ['time', 'open', 'high', 'low', 'close', 'volume']
@@ -141,21 +162,20 @@ def ohlc_to_df(data: Dict[str, Any], column_map: Dict[str, str], dtype_map: Dict
     if 'time' in df.columns:
         if source == 'VCI':
             # VCI uses integer timestamps
-            df['time'] = pd.to_datetime(df['time'].astype(int), unit='s').dt.tz_localize('UTC')
-            df['time'] = df['time'].dt.tz_convert('Asia/Ho_Chi_Minh')
+            df['time'] = pd.to_datetime(df['time'].to_numpy(), unit='s', utc=True).tz_convert('Asia/Ho_Chi_Minh')
         else:
             # TCBS and others might use string formats
             df['time'] = pd.to_datetime(df['time'], errors='coerce')
     
-    # Price scaling for non-index/derivative assets
-    if asset_type not in ["index", "derivative"]:
-        df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].div(1000)
-    
-    # Round price columns
-    df[["open", "high", "low", "close"]] = df[["open", "high", "low", "close"]].round(floating)
-    
-    # Resample if needed
-    if resample_map and interval not in ["1m", "1H", "1D"]:
+    if source == 'TCBS':
+        # Scale and round prices (already done at construction for columnar sources)
+        if price_scale:
+            df[price_columns] = df[price_columns].div(price_scale)
+        df[price_columns] = df[price_columns].round(floating)
+    
+    # Resample if needed (aggregation runs in pandas' Cython groupby, which also handles
+    # calendar-anchored W/M bins and empty buckets)
+    if needs_resample:
         df = df.set_index('time').resample(resample_map[interval]).agg({
             'open': 'first',
             'high': 'max',
@@ -170,8 +190,14 @@ def ohlc_to_df(data: Dict[str, Any], column_map: Dict[str, str], dtype_map: Dict
             if dtype == "datetime64[ns]" and hasattr(df[col], 'dt') and df[col].dt.tz is not None:
                 df[col] = df[col].dt.tz_localize(None)  # Remove timezone info
                 if interval == "1D":
-                    df[col] = df[col].dt.date
-            df[col] = df[col].astype(dtype)
+                    df[col] = df[col].dt.normalize()  # Keep the date part only
+            # Skip the cast (and its copy) when the column already has the target dtype
+            if df[col].dtype != dtype:
+                df[col] = df[col].astype(dtype)
+
+    # Keep the last count_back bars (no-op when already trimmed above)
+    if count_back is not None and len(df) > count_back:
+        df = df.tail(count_back)
     
     # Add metadata
     df.name = symbol
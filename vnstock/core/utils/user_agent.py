@@ -1,6 +1,7 @@
 # vnstock/vnstock/core/utils/user_agent.py
 
 import random
+from functools import lru_cache
 from vnstock.core.utils.browser_profiles import USER_AGENTS
 
 DEFAULT_HEADERS = {
@@ -69,16 +70,32 @@ def get_headers(
     Returns:
         dict: HTTP headers with realistic settings.
     """
-    ref_origin = HEADERS_MAPPING_SOURCE.get(data_source.upper(), {})
-    referer = ref_origin.get("Referer", "")
-    origin = ref_origin.get("Origin", "")
-
     # Determine browser/platform
     if random_agent:
         browser = random.choice(list(USER_AGENTS.keys()))
         platform = random.choice(list(USER_AGENTS[browser].keys()))
 
-    ua = USER_AGENTS.get(browser.lower(), {}).get(platform.lower())
+    # Return a copy so callers can safely modify their own headers
+    return _build_headers(data_source.upper(), browser.lower(), platform.lower()).copy()
+
+@lru_cache(maxsize=128)
+def _build_headers(data_source: str, browser: str, platform: str) -> dict:
+    """
+    Build and cache headers for a given data source, browser and platform combination.
+
+    Args:
+        data_source (str): Upper-cased data source name.
+        browser (str): Lower-cased browser name.
+        platform (str): Lower-cased platform name.
+
+    Returns:
+        dict: HTTP headers shared by every call with the same arguments (do not mutate).
+    """
+    ref_origin = HEADERS_MAPPING_SOURCE.get(data_source, {})
+    referer = ref_origin.get("Referer", "")
+    origin = ref_origin.get("Origin", "")
+
+    ua = USER_AGENTS.get(browser, {}).get(platform)
 
     if not ua:
         # Fallback to first available platform under chrome or first browser available
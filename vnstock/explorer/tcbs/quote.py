@@ -9,7 +9,7 @@ from .const import (_BASE_URL, _STOCKS_URL, _FUTURE_URL, _INTERVAL_MAP, _OHLC_MA
 from .models import TickerModel
 from vnai import optimize_execution
 from vnstock.core.utils.logger import get_logger
-from vnstock.core.utils.market import trading_hours
+from vnstock.core.utils.market import cached_trading_hours
 from vnstock.core.utils.parser import get_asset_type
 from vnstock.core.utils.validation import validate_symbol
 from vnstock.core.utils.user_agent import get_headers
@@ -229,7 +229,7 @@ class Quote:
         """
         Truy xuất dữ liệu khớp lệnh của mã chứng khoán bất kỳ từ nguồn dữ liệu TCBS
         """
-        market_status = trading_hours(None)
+        market_status = cached_trading_hours(None)
         if market_status['is_trading_hour'] is False and market_status['data_status'] == 'preparing':
             raise ValueError(f"{market_status['time']}: Dữ liệu khớp lệnh không thể truy cập trong thời gian chuẩn bị phiên mới. Vui lòng quay lại sau.")
 
@@ -14,6 +14,16 @@ _INTERVAL_MAP = {'1m' : 'ONE_MINUTE',
             '1M' : 'ONE_DAY'
             }
 
+# Bar length in seconds per interval, used to derive countBack from the requested time range
+_INTERVAL_SECONDS = {'1m' : 60,
+            '5m' : 300,
+            '15m' : 900,
+            '30m' : 1800,
+            '1H' : 3600,
+            '1D' : 86400,
+            '1W' : 604800
+            }
+
 _RESAMPLE_MAP = {
             '5m' : '5min',
             '15m' : '15min',
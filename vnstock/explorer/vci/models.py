@@ -1,5 +1,6 @@
 """Mô hình xác thực dữ liệu đầu vào cho VCI"""
 from pydantic import BaseModel
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
@@ -8,3 +9,11 @@ class TickerModel(BaseModel):
     start: str
     end: Optional[str] = None
     interval: Optional[str] = "1D"
+
+@dataclass(slots=True, frozen=True)
+class Ticker:
+    """Bản nhẹ của TickerModel dùng trong Quote.history, kiểm tra định dạng ngày bằng regex thay cho Pydantic."""
+    symbol: str
+    start: str
+    end: Optional[str] = None
+    interval: Optional[str] = "1D"
@@ -1,17 +1,20 @@
 """History module for VCI."""
 
-from typing import Dict, Optional, Union
+import re
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import pandas as pd
 from vnai import optimize_execution
 from .const import (
-    _TRADING_URL, _CHART_URL, _INTERVAL_MAP, 
+    _TRADING_URL, _CHART_URL, _INTERVAL_MAP, _INTERVAL_SECONDS,
     _OHLC_MAP, _RESAMPLE_MAP, _OHLC_DTYPE, _INTRADAY_URL, 
     _INTRADAY_MAP, _INTRADAY_DTYPE, _PRICE_DEPTH_MAP, _INDEX_MAPPING
 )
-from .models import TickerModel
+from .models import Ticker
 from vnstock.core.utils.logger import get_logger
-from vnstock.core.utils.market import trading_hours
+from vnstock.core.utils.market import cached_trading_hours
 from vnstock.core.utils.parser import get_asset_type
 from vnstock.core.utils.validation import validate_symbol
 from vnstock.core.utils.user_agent import get_headers
@@ -20,6 +23,22 @@ from vnstock.core.utils.transform import ohlc_to_df, intraday_to_df
 
 logger = get_logger(__name__)
 
+_DATE_RE = re.compile(r"\d{4}-\d{1,2}-\d{1,2}")
+
+@lru_cache(maxsize=1024)
+def _validate_ticker(symbol: str, start: str, end: Optional[str], interval: str) -> Ticker:
+    """
+    Validate input data, caching the result for repeated (symbol, start, end, interval) combinations.
+    """
+    if not isinstance(start, str) or not _DATE_RE.fullmatch(start):
+        raise ValueError(f"Thời gian bắt đầu không hợp lệ: {start}. Vui lòng nhập theo định dạng YYYY-MM-DD")
+    if end is not None and (not isinstance(end, str) or not _DATE_RE.fullmatch(end)):
+        raise ValueError(f"Thời gian kết thúc không hợp lệ: {end}. Vui lòng nhập theo định dạng YYYY-MM-DD")
+    if interval not in _INTERVAL_MAP:
+        raise ValueError(f"Giá trị interval không hợp lệ: {interval}. Vui lòng chọn: 1m, 5m, 15m, 30m, 1H, 1D, 1W, 1M")
+
+    return Ticker(symbol=symbol, start=start, end=end, interval=interval)
+
 class Quote:
     """
     The Quote class is used to fetch historical price data from VCI.
@@ -39,7 +58,9 @@ class Quote:
         self.headers = get_headers(data_source=self.data_source, random_agent=random_agent)
         self.interval_map = _INTERVAL_MAP
         self.show_log = show_log
+        self.random_agent = random_agent
         self.proxy_config = proxy_config if proxy_config is not None else ProxyConfig()
+        self.failed_symbols: Dict[str, str] = {}  # Mã lỗi ở lần gọi history_many/history_batch gần nhất
 
         if not show_log:
             logger.setLevel('CRITICAL')
@@ -59,12 +80,36 @@ class Quote:
         """
         Validate input data
         """
-        ticker = TickerModel(symbol=self.symbol, start=start, end=end, interval=interval)
+        return _validate_ticker(self.symbol, start, end, interval)
 
-        if ticker.interval not in self.interval_map:
-            raise ValueError(f"Giá trị interval không hợp lệ: {ticker.interval}. Vui lòng chọn: 1m, 5m, 15m, 30m, 1H, 1D, 1W, 1M")
+    def _time_range(self, ticker: Ticker, count_back: Optional[int]=None) -> Tuple[int, int]:
+        """
+        Tính mốc thời gian kết thúc (epoch giây) và số nến cần lấy cho request lịch sử giá.
+        """
+        start_time = datetime.strptime(ticker.start, "%Y-%m-%d")
+
+        # Calculate end timestamp
+        if ticker.end is not None:
+            end_time = datetime.strptime(ticker.end, "%Y-%m-%d") + pd.Timedelta(days=1)
+            if start_time > end_time:
+                raise ValueError("Thời gian bắt đầu không thể lớn hơn thời gian kết thúc.")
+            end_stamp = int(end_time.timestamp())
+        else:
+            end_time = datetime.now() + pd.Timedelta(days=1)
+            end_stamp = int(end_time.timestamp())
+
+        # Tính count_back nếu chưa truyền vào
+        if count_back is None:
+            if ticker.interval == "1M":
+                # Số tháng theo lịch giữa thời điểm bắt đầu và kết thúc
+                count_back = (end_time.year - start_time.year) * 12 + (end_time.month - start_time.month)
+            else:
+                # Số nến = khoảng thời gian (giây) chia cho độ dài một nến, tính trên datetime naive để không lệch theo DST
+                count_back = int((end_time - start_time).total_seconds()) // _INTERVAL_SECONDS[ticker.interval]
+            if count_back <= 0:
+                count_back = 1
 
-        return ticker
+        return end_stamp, count_back
 
     @optimize_execution("VCI")
     def history(self, start: str, end: Optional[str]=None, interval: Optional[str]="1D", 
@@ -84,58 +129,10 @@ class Quote:
         """
         # Validate inputs
         ticker = self._input_validation(start, end, interval)
-
-        start_time = datetime.strptime(ticker.start, "%Y-%m-%d")
-
-        # Calculate end timestamp
-        if end is not None:
-            end_time = datetime.strptime(ticker.end, "%Y-%m-%d") + pd.Timedelta(days=1)
-            if start_time > end_time:
-                raise ValueError("Thời gian bắt đầu không thể lớn hơn thời gian kết thúc.")
-            end_stamp = int(end_time.timestamp())
-        else:
-            end_time = datetime.now() + pd.Timedelta(days=1)
-            end_stamp = int(end_time.timestamp())
+        end_stamp, count_back = self._time_range(ticker, count_back)
 
         interval_value = self.interval_map[ticker.interval]
 
-        # Tính count_back nếu chưa truyền vào
-        if count_back is None:
-            # Chuẩn hóa interval_value về 3 loại gốc của VCI
-            # _INTERVAL_MAP = {'1m' : 'ONE_MINUTE', '5m' : 'ONE_MINUTE', '15m' : 'ONE_MINUTE', '30m' : 'ONE_MINUTE',
-            #                 '1H' : 'ONE_HOUR', '1D' : 'ONE_DAY', '1W' : 'ONE_DAY', '1M' : 'ONE_DAY'}
-            interval = ticker.interval.lower()
-            if interval in ["1d", "1w", "1m"]:
-                # Dùng ONE_DAY
-                delta = end_time.date() - start_time.date()
-                count_back = delta.days
-                if interval == "1w":
-                    count_back = count_back // 7
-                elif interval == "1m":
-                    count_back = (end_time.year - start_time.year) * 12 + (end_time.month - start_time.month)
-            elif interval in ["1h"]:
-                # Dùng ONE_HOUR
-                total_hours = int((end_time - start_time).total_seconds() // 3600)
-                count_back = total_hours
-            elif interval in ["1m", "5m", "15m", "30m"]:
-                # Dùng ONE_MINUTE
-                total_minutes = int((end_time - start_time).total_seconds() // 60)
-                if interval == "1m":
-                    count_back = total_minutes
-                elif interval == "5m":
-                    count_back = total_minutes // 5
-                elif interval == "15m":
-                    count_back = total_minutes // 15
-                elif interval == "30m":
-                    count_back = total_minutes // 30
-                else:
-                    count_back = total_minutes
-            else:
-                # fallback: 30
-                count_back = 30
-            if count_back <= 0:
-                count_back = 1
-
         # Prepare request
         url = self.base_url + _CHART_URL
         payload = {
@@ -172,17 +169,145 @@ class Quote:
             source=self.data_source, 
             interval=ticker.interval, 
             floating=floating,
-            resample_map=_RESAMPLE_MAP
+            resample_map=_RESAMPLE_MAP,
+            count_back=count_back
         )
 
-        if count_back is not None:
-            df = df.tail(count_back)
-
         if to_df:
             return df
         else:
+            # pandas' built-in C encoder is faster than orjson for record-oriented output and keeps epoch-ms timestamps
             return df.to_json(orient='records')
 
+    def history_many(self, symbols: List[str], start: str, end: Optional[str]=None, interval: Optional[str]="1D",
+                     to_df: Optional[bool]=True, show_log: Optional[bool]=False,
+                     count_back: Optional[int]=None, floating: Optional[int]=2,
+                     max_workers: Optional[int]=8) -> Dict[str, Union[pd.DataFrame, str]]:
+        """
+        Tải đồng thời lịch sử giá của nhiều mã chứng khoán từ nguồn dữ liệu VCI.
+        Các request chạy song song và dùng chung connection pool, nên tổng thời gian xấp xỉ một lần gọi history.
+
+        Tham số:
+            - symbols (bắt buộc): danh sách mã chứng khoán cần lấy dữ liệu.
+            - max_workers (tùy chọn): Số request chạy song song tối đa. Mặc định là 8.
+            - Các tham số còn lại giống phương thức history.
+
+        Trả về:
+            - Dict ánh xạ mã chứng khoán sang dữ liệu lịch sử tương ứng. Mã bị lỗi khi truy xuất sẽ bị bỏ qua
+              và được ghi lại kèm nguyên nhân trong thuộc tính failed_symbols.
+        """
+        # Kiểm tra tham số một lần trước khi gửi request, lỗi đầu vào được raise như phương thức history
+        ticker = self._input_validation(start, end, interval)
+        self._time_range(ticker, count_back)
+
+        def _fetch(symbol: str) -> Union[pd.DataFrame, str]:
+            quote = self.__class__(symbol, random_agent=self.random_agent,
+                                   proxy_config=self.proxy_config, show_log=self.show_log)
+            return quote.history(start=start, end=end, interval=interval, to_df=to_df, show_log=show_log,
+                                 count_back=count_back, floating=floating)
+
+        fetched = {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_fetch, symbol): symbol for symbol in symbols}
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    fetched[symbol] = future.result()
+                except (ConnectionError, ValueError) as e:
+                    errors[symbol] = str(e)
+                    logger.warning(f"Không thể tải dữ liệu cho mã {symbol}: {e}")
+
+        self.failed_symbols = {symbol: errors[symbol] for symbol in symbols if symbol in errors}
+        if symbols and not fetched:
+            details = "; ".join(f"{symbol}: {error}" for symbol, error in self.failed_symbols.items())
+            raise ValueError(f"Không tải được dữ liệu cho bất kỳ mã nào. {details}")
+
+        # Giữ thứ tự kết quả theo danh sách mã đầu vào
+        return {symbol: fetched[symbol] for symbol in symbols if symbol in fetched}
+
+    @optimize_execution("VCI")
+    def history_batch(self, symbols: List[str], start: str, end: Optional[str]=None, interval: Optional[str]="1D",
+                      to_df: Optional[bool]=True, show_log: Optional[bool]=False,
+                      count_back: Optional[int]=None, floating: Optional[int]=2) -> Dict[str, Union[pd.DataFrame, str]]:
+        """
+        Tải lịch sử giá của nhiều mã chứng khoán trong một request duy nhất tới nguồn dữ liệu VCI.
+
+        Tham số:
+            - symbols (bắt buộc): danh sách mã chứng khoán cần lấy dữ liệu.
+            - Các tham số còn lại giống phương thức history.
+
+        Trả về:
+            - Dict ánh xạ mã chứng khoán sang dữ liệu lịch sử tương ứng. Mã không có dữ liệu sẽ bị bỏ qua
+              và được ghi lại trong thuộc tính failed_symbols.
+        """
+        # Validate inputs
+        ticker = self._input_validation(start, end, interval)
+        end_stamp, count_back = self._time_range(ticker, count_back)
+
+        self.failed_symbols = {}
+        if not symbols:
+            return {}
+
+        # Chuẩn hóa từng mã (kiểm tra hợp lệ, ánh xạ mã chỉ số, xác định loại tài sản)
+        quotes = [self.__class__(symbol, random_agent=self.random_agent,
+                                 proxy_config=self.proxy_config, show_log=self.show_log) for symbol in symbols]
+
+        # Prepare request
+        url = self.base_url + _CHART_URL
+        payload = {
+            "timeFrame": self.interval_map[ticker.interval],
+            "symbols": [quote.symbol for quote in quotes],
+            "to": end_stamp,
+            "countBack": count_back
+        }
+
+        json_data = send_request(
+            url=url, 
+            headers=self.headers, 
+            method="POST", 
+            payload=payload, 
+            show_log=show_log,
+            proxy_list=self.proxy_config.proxy_list,
+            proxy_mode=self.proxy_config.proxy_mode,
+            request_mode=self.proxy_config.request_mode,
+            hf_proxy_url=self.proxy_config.hf_proxy_url
+        )
+
+        if not json_data:
+            raise ValueError("Không tìm thấy dữ liệu. Vui lòng kiểm tra lại mã chứng khoán hoặc thời gian truy xuất.")
+
+        # Ghép dữ liệu trả về với mã tương ứng theo trường symbol, nếu thiếu thì theo thứ tự request
+        if all('symbol' in item for item in json_data):
+            data_by_symbol = {item['symbol']: item for item in json_data}
+        elif len(json_data) == len(quotes):
+            data_by_symbol = {item.get('symbol', quote.symbol): item for item, quote in zip(json_data, quotes)}
+        else:
+            raise ValueError(f"Dữ liệu trả về không có trường symbol và có {len(json_data)} phần tử, không khớp với {len(quotes)} mã yêu cầu.")
+
+        results = {}
+        for symbol, quote in zip(symbols, quotes):
+            data = data_by_symbol.get(quote.symbol)
+            if not data:
+                self.failed_symbols[symbol] = "Không tìm thấy dữ liệu"
+                logger.warning(f"Không tìm thấy dữ liệu cho mã {symbol}.")
+                continue
+            df = ohlc_to_df(
+                data=data, 
+                column_map=_OHLC_MAP, 
+                dtype_map=_OHLC_DTYPE, 
+                asset_type=quote.asset_type, 
+                symbol=quote.symbol, 
+                source=self.data_source, 
+                interval=ticker.interval, 
+                floating=floating,
+                resample_map=_RESAMPLE_MAP,
+                count_back=count_back
+            )
+            results[symbol] = df if to_df else df.to_json(orient='records')
+
+        return results
+
     @optimize_execution("VCI")
     def intraday(self, page_size: Optional[int]=100, last_time: Optional[str]=None, 
                 to_df: Optional[bool]=True, show_log: bool=False) -> Union[pd.DataFrame, str]:
@@ -195,7 +320,7 @@ class Quote:
             - to_df (tùy chọn): Chuyển đổi dữ liệu lịch sử trả về dưới dạng DataFrame. Mặc định là True.
             - show_log (tùy chọn): Hiển thị thông tin log giúp debug dễ dàng. Mặc định là False.
         """
-        market_status = trading_hours(None)
+        market_status = cached_trading_hours(None)
         if market_status['is_trading_hour'] is False and market_status['data_status'] == 'preparing':
             raise ValueError(f"{market_status['time']}: Dữ liệu khớp lệnh không thể truy cập trong thời gian chuẩn bị phiên mới. Vui lòng quay lại sau.")
 
@@ -249,7 +374,7 @@ class Quote:
             - to_df (tùy chọn): Chuyển đổi dữ liệu lịch sử trả về dưới dạng DataFrame. Mặc định là True.
             - show_log (tùy chọn): Hiển thị thông tin log giúp debug dễ dàng. Mặc định là False.
         """
-        market_status = trading_hours(None)
+        market_status = cached_trading_hours(None)
         if market_status['is_trading_hour'] is False and market_status['data_status'] == 'preparing':
             raise ValueError(f"{market_status['time']}: Dữ liệu khớp lệnh không thể truy cập trong thời gian chuẩn bị phiên mới. Vui lòng quay lại sau.")
 
@@ -274,12 +399,9 @@ class Quote:
             hf_proxy_url=self.proxy_config.hf_proxy_url
         )
 
-        # Process the data to DataFrame
-        df = pd.DataFrame(data)
-        
-        # Select columns in _PRICE_DEPTH_MAP values and rename them
-        df = df[_PRICE_DEPTH_MAP.keys()]
-        df.rename(columns=_PRICE_DEPTH_MAP, inplace=True)
+        # Build only the columns in _PRICE_DEPTH_MAP, then rename them
+        df = pd.DataFrame.from_records(data, columns=list(_PRICE_DEPTH_MAP.keys()))
+        df.columns = list(_PRICE_DEPTH_MAP.values())
         
         df.source = self.data_source
 